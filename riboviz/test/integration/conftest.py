@@ -36,12 +36,19 @@ and the use of ``pytest_addoption`` to support custom command-line
 options and ``pytest_generate_tests`` to support custom
 parameterization.
 """
+import functools
 import os.path
+import re
+import stat
+import types
 import pytest
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import riboviz
 from riboviz import environment
-from riboviz import fastq
 from riboviz import params
 from riboviz import sample_sheets
 from riboviz import test
@@ -55,6 +62,113 @@ CHECK_INDEX_TMP = "--check-index-tmp"
 CONFIG_FILE = "--config-file"
 """ Configuration file command-line flag. """
 
+MULTIPLEX_NAME_RE = re.compile(r'\.(?:fastq|fq)\.gz$|\.[^.]*$',
+                               re.IGNORECASE)
+"""
+Pattern matching the extension of a multiplexed FASTQ file name
+(``.fastq.gz``, ``.fq.gz`` or any single trailing extension, in any
+case), used to strip file names down to their prefixes.
+"""
+
+
+def _assert_dir(directory):
+    """
+    Validate that a directory exists, with a single ``stat`` call
+    rather than separate exists and isdir checks.
+
+    :param directory: Directory
+    :type directory: str or unicode
+    :raise AssertionError: if there is no such directory
+    """
+    try:
+        status = os.stat(directory)
+    except OSError:
+        raise AssertionError("No such directory: %s" % directory)
+    assert stat.S_ISDIR(status.st_mode), \
+        "No such directory: %s" % directory
+
+
+def _assert_file(file_name):
+    """
+    Validate that a file exists, with a single ``stat`` call rather
+    than separate exists and isfile checks.
+
+    :param file_name: File name
+    :type file_name: str or unicode
+    :raise AssertionError: if there is no such file
+    """
+    try:
+        status = os.stat(file_name)
+    except OSError:
+        raise AssertionError("No such file: %s" % file_name)
+    assert stat.S_ISREG(status.st_mode), \
+        "No such file: %s" % file_name
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(config_file):
+    """
+    Load a configuration file and replace environment variable tokens
+    with environment variables in configuration parameter values that
+    support environment variables.
+
+    The configuration is cached, keyed by ``config_file``, so the
+    file is opened and parsed, and the environment variable
+    substitution applied, once per session, not once per test
+    function collected by :py:func:`pytest_generate_tests`. All
+    callers see the already-substituted values.
+
+    :param config_file: Configuration file
+    :type config_file: str or unicode
+    :return: configuration
+    :rtype: dict
+    """
+    with open(config_file, 'rb') as f:
+        config = yaml.load(f.read(), SafeLoader)
+    environment.apply_env_to_config(config)
+    return config
+
+
+@functools.lru_cache(maxsize=None)
+def _load_default_config():
+    """
+    Load the default configuration file,
+    :py:const:`riboviz.params.DEFAULT_CONFIG_YAML_FILE`. The
+    configuration is cached so the file is opened and parsed once per
+    session.
+
+    :return: configuration
+    :rtype: dict
+    """
+    default_config_file = os.path.join(os.path.dirname(riboviz.__file__),
+                                       params.DEFAULT_CONFIG_YAML_FILE)
+    with open(default_config_file, "rb") as f:
+        return yaml.load(f.read(), SafeLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_sample_sheet_ids(sample_sheet_file):
+    """
+    Get the sample IDs from a sample sheet. The IDs are cached,
+    keyed by ``sample_sheet_file``, so the sample sheet is parsed
+    once per session.
+
+    :param sample_sheet_file: Sample sheet file
+    :type sample_sheet_file: str or unicode
+    :return: sample IDs
+    :rtype: list(str or unicode)
+    """
+    sample_sheet = sample_sheets.load_sample_sheet(sample_sheet_file)
+    return list(sample_sheet[sample_sheets.SAMPLE_ID])
+
+
+PARAMETRIZABLE_FIXTURES = frozenset(_load_default_config()) | frozenset(
+    ["index_prefix", "is_multiplexed", "multiplex_name", "sample"])
+"""
+Names of every test parameter that :py:func:`pytest_generate_tests`
+can parameterise a test function with.
+"""
+
 
 def pytest_addoption(parser):
     """
@@ -81,68 +195,189 @@ def pytest_addoption(parser):
                      help="Configuration file")
 
 
-@pytest.fixture(scope="module")
-def expected_fixture(request):
+@pytest.fixture(scope="session")
+def options_fixture(request):
     """
-    Gets value for :py:const:`EXPECTED` command-line option.
+    Gets values for all custom command-line options in a single
+    bundle, so each option is extracted, and the :py:const:`EXPECTED`
+    directory validated, once per session rather than once per
+    module.
 
     :param request: request
     :type request: _pytest.fixtures.SubRequest
+    :return: options, with attributes ``expected``,
+    ``skip_workflow``, ``check_index_tmp`` and ``config_file`` \
+    (default :py:const:`riboviz.test.VIGNETTE_CONFIG`)
+    :rtype: types.SimpleNamespace
+    :raise AssertionError: if the :py:const:`EXPECTED` option has a \
+    value that is not a directory
+    """
+    options = types.SimpleNamespace(
+        expected=request.config.getoption(EXPECTED),
+        skip_workflow=request.config.getoption(SKIP_WORKFLOW),
+        check_index_tmp=request.config.getoption(CHECK_INDEX_TMP),
+        config_file=(request.config.getoption(CONFIG_FILE)
+                     or test.VIGNETTE_CONFIG))
+    _assert_dir(options.expected)
+    return options
+
+
+@pytest.fixture(scope="module")
+def expected_fixture(options_fixture):
+    """
+    Gets value for :py:const:`EXPECTED` command-line option.
+
+    :param options_fixture: command-line options
+    :type options_fixture: types.SimpleNamespace
     :return: directory
     :rtype: str or unicode
     :raise AssertionError: if the option has a value that is \
     not a directory
     """
-    expected_dir = request.config.getoption(EXPECTED)
-    assert os.path.exists(expected_dir) and os.path.isdir(expected_dir),\
-        "No such directory: %s" % expected_dir
-    return expected_dir
+    return options_fixture.expected
 
 
 @pytest.fixture(scope="module")
-def skip_workflow_fixture(request):
+def skip_workflow_fixture(options_fixture):
     """
     Gets value for :py:const:`SKIP_WORKFLOW` command-line option.
 
-    :param request: request
-    :type request: _pytest.fixtures.SubRequest
+    :param options_fixture: command-line options
+    :type options_fixture: types.SimpleNamespace
     :return: flag
     :rtype: bool
     """
-    return request.config.getoption(SKIP_WORKFLOW)
+    return options_fixture.skip_workflow
 
 
-@pytest.fixture(scope="module")
-def skip_index_tmp_fixture(request):
+def pytest_configure(config):
     """
-    Gets value for :py:const:`CHECK_INDEX_TMP` command-line option.
-    If ``False``, or undefined, invokes ``pytest.skip`` to skip
-    a test that uses this fixture.
+    Register the ``check_index_tmp`` marker, for tests that check
+    index and temporary files.
 
-    :param request: request
-    :type request: _pytest.fixtures.SubRequest
-    :return: flag
-    :rtype: bool
+    :param config: pytest configuration
+    :type config: _pytest.config.Config
+    """
+    config.addinivalue_line(
+        "markers",
+        "check_index_tmp: test checks index and temporary files")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    If the :py:const:`CHECK_INDEX_TMP` command-line option is
+    ``False``, or undefined, mark every test with the
+    ``check_index_tmp`` marker as skipped. Skipping at collection
+    time avoids per-test fixture setup for tests that would be
+    skipped anyway.
+
+    :param config: pytest configuration
+    :type config: _pytest.config.Config
+    :param items: test items collected
+    :type items: list(_pytest.nodes.Item)
     """
-    if not request.config.getoption(CHECK_INDEX_TMP):
-        pytest.skip('Skipped index and temporary files tests')
+    if config.getoption(CHECK_INDEX_TMP):
+        return
+    skip_index_tmp = pytest.mark.skip(
+        reason='Skipped index and temporary files tests')
+    for item in items:
+        if "check_index_tmp" in item.keywords:
+            item.add_marker(skip_index_tmp)
 
 
 @pytest.fixture(scope="module")
-def config_fixture(request):
+def config_fixture(options_fixture):
     """
-    Gets value for :py:const:`CONFIG_FILE` command-line option.
+    Gets value for :py:const:`CONFIG_FILE` command-line option,
+    or :py:const:`riboviz.test.VIGNETTE_CONFIG` if undefined.
 
-    :param request: request
-    :type request: _pytest.fixtures.SubRequest
+    :param options_fixture: command-line options
+    :type options_fixture: types.SimpleNamespace
     :return: configuration file
     :rtype: str or unicode
     """
-    if request.config.getoption(CONFIG_FILE):
-        config_file = request.config.getoption(CONFIG_FILE)
-    else:
-        config_file = test.VIGNETTE_CONFIG
-    return config_file
+    return options_fixture.config_file
+
+
+@functools.lru_cache(maxsize=None)
+def _build_test_params(config_file, expected_dir):
+    """
+    Build the test parameters that :py:func:`pytest_generate_tests`
+    uses to parameterise test functions (see
+    :py:func:`pytest_generate_tests` for a description of each
+    parameter). The dictionary is cached, keyed by ``config_file``
+    and ``expected_dir``, so it is built once per session, not once
+    per test function collected.
+
+    :param config_file: Configuration file
+    :type config_file: str or unicode
+    :param expected_dir: Directory with expected data files
+    :type expected_dir: str or unicode
+    :return: test parameters, mapping parameter names to lists of \
+    values
+    :rtype: dict
+    """
+    config = _load_config(config_file)
+    multiplex_fq_files = config.get(params.MULTIPLEX_FQ_FILES) or []
+    fq_files = config.get(params.FQ_FILES) or {}
+    is_multiplexed = bool(multiplex_fq_files)
+    test_params = {param: [config.get(param, default)]
+                   for param, default in _load_default_config().items()}
+    test_params["index_prefix"] = [config[params.ORF_INDEX_PREFIX],
+                                   config[params.RRNA_INDEX_PREFIX]]
+    test_params["is_multiplexed"] = [is_multiplexed]
+    test_params["multiplex_name"] = [
+        MULTIPLEX_NAME_RE.sub('', file_name)
+        for file_name in multiplex_fq_files
+    ]
+    samples = []
+    if fq_files:
+        samples = list(fq_files.keys())
+    elif is_multiplexed:
+        # Get samples from sample sheet.
+        sample_sheet_file = os.path.join(
+            config[params.INPUT_DIR],
+            config[params.SAMPLE_SHEET])
+        sample_sheet_samples = set(_load_sample_sheet_ids(sample_sheet_file))
+        # Scan folder/file names in the output directory. These
+        # include output folders for the samples which were
+        # demultiplexed and other files. Keep names of samples
+        # for which output files exist.
+        expected_out = os.path.join(
+            expected_dir,
+            os.path.basename(os.path.normpath(config[params.OUTPUT_DIR])))
+        with os.scandir(expected_out) as entries:
+            samples = [entry.name for entry in entries
+                       if entry.name in sample_sheet_samples]
+    if test.VIGNETTE_MISSING_SAMPLE in samples:
+        samples.remove(test.VIGNETTE_MISSING_SAMPLE)
+    test_params["sample"] = samples
+    return test_params
+
+
+@functools.lru_cache(maxsize=None)
+def _build_test_param_ids(config_file, expected_dir):
+    """
+    Build test IDs for the test parameter values returned by
+    :py:func:`_build_test_params`, so these are computed once per
+    session rather than inferred by pytest for every parametrize
+    call. Scalar values get ``str`` IDs, matching those pytest would
+    infer; ``None`` IDs defer to pytest's auto-generated IDs.
+
+    :param config_file: Configuration file
+    :type config_file: str or unicode
+    :param expected_dir: Directory with expected data files
+    :type expected_dir: str or unicode
+    :return: test IDs, mapping parameter names to lists of IDs
+    :rtype: dict
+    """
+    return {test_param: [str(value)
+                         if value is None or isinstance(
+                             value, (str, int, float))
+                         else None
+                         for value in values]
+            for test_param, values
+            in _build_test_params(config_file, expected_dir).items()}
 
 
 def pytest_generate_tests(metafunc):
@@ -197,65 +432,18 @@ def pytest_generate_tests(metafunc):
     :raise AssertionError: if the configuration file does not \
     exist or is not a file
     """
+    fixture_names = frozenset(metafunc.fixturenames)
+    if not PARAMETRIZABLE_FIXTURES.intersection(fixture_names):
+        return
     if metafunc.config.getoption(CONFIG_FILE):
         config_file = metafunc.config.getoption(CONFIG_FILE)
     else:
         config_file = test.VIGNETTE_CONFIG
-    assert os.path.exists(config_file) and os.path.isfile(config_file),\
-        "No such file: %s" % config_file
-    with open(config_file, 'r') as f:
-        config = yaml.load(f, yaml.SafeLoader)
-    default_config_file = os.path.join(os.path.dirname(riboviz.__file__),
-                                       params.DEFAULT_CONFIG_YAML_FILE)
-    with open(default_config_file, "r") as f:
-        default_config = yaml.load(f, yaml.SafeLoader)
-    # Replace environment variable tokens with environment variables
-    # in configuration parameter values that support environment
-    # variables
-    environment.apply_env_to_config(config)
-    test_params = {}
-    for param, default in default_config.items():
-        test_params[param] = [default if param not in config
-                              else config[param]]
-    test_params["index_prefix"] = [config[params.ORF_INDEX_PREFIX],
-                                   config[params.RRNA_INDEX_PREFIX]]
-    test_params["is_multiplexed"] = [
-        params.MULTIPLEX_FQ_FILES in config
-        and config[params.MULTIPLEX_FQ_FILES]]
-    if "multiplex_name" in metafunc.fixturenames:
-        multiplex_names = []
-        if params.MULTIPLEX_FQ_FILES in config and config[params.MULTIPLEX_FQ_FILES]:
-            multiplex_names = [
-                os.path.splitext(fastq.strip_fastq_gz(file_name))[0]
-                for file_name in config[params.MULTIPLEX_FQ_FILES]
-            ]
-        test_params['multiplex_name'] = multiplex_names
-    if "sample" in metafunc.fixturenames:
-        samples = []
-        if params.FQ_FILES in config and config[params.FQ_FILES]:
-            samples = list(config[params.FQ_FILES].keys())
-        elif params.MULTIPLEX_FQ_FILES in config and config[params.MULTIPLEX_FQ_FILES]:
-            # Get samples from sample sheet.
-            sample_sheet_file = os.path.join(
-                config[params.INPUT_DIR],
-                config[params.SAMPLE_SHEET])
-            sample_sheet = sample_sheets.load_sample_sheet(
-                sample_sheet_file)
-            sample_sheet_samples = list(sample_sheet[sample_sheets.SAMPLE_ID])
-            # Get folder/file names from output directory. These
-            # include output folders for the samples which were
-            # demultiplexed and other files.
-            expected_dir = metafunc.config.getoption(EXPECTED)
-            expected_out = os.path.join(
-                expected_dir,
-                os.path.basename(os.path.normpath(config[params.OUTPUT_DIR])))
-            output_samples = os.listdir(expected_out)
-            # Get names of samples for which output files exist.
-            samples = list(set(sample_sheet_samples).intersection(
-                set(output_samples)))
-        if test.VIGNETTE_MISSING_SAMPLE in samples:
-            samples.remove(test.VIGNETTE_MISSING_SAMPLE)
-        test_params["sample"] = samples
+    _assert_file(config_file)
+    expected_dir = metafunc.config.getoption(EXPECTED)
+    test_params = _build_test_params(config_file, expected_dir)
+    test_param_ids = _build_test_param_ids(config_file, expected_dir)
     for test_param, value in test_params.items():
-        if test_param in metafunc.fixturenames:
-            metafunc.parametrize(test_param, value)
+        if test_param in fixture_names:
+            metafunc.parametrize(test_param, value,
+                                 ids=test_param_ids[test_param])
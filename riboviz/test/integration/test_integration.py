@@ -199,7 +199,7 @@ def compare_sam_files(expected_directory, directory,
     sam_bam.equal_sam(expected_copy_file, actual_copy_file)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 @pytest.mark.parametrize("index", list(range(1, test.NUM_INDICES)))
 def test_hisat2_build_index(build_indices, expected_fixture, dir_index,
@@ -230,7 +230,7 @@ def test_hisat2_build_index(build_indices, expected_fixture, dir_index,
         os.path.join(dir_index, file_name))
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_cutadapt_fq(is_multiplexed, expected_fixture, dir_tmp, sample):
     """
@@ -255,7 +255,7 @@ def test_cutadapt_fq(is_multiplexed, expected_fixture, dir_tmp, sample):
                      workflow_files.ADAPTER_TRIM_FQ)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_multiplex_cutadapt_fq(expected_fixture, dir_tmp, multiplex_name):
     """
@@ -278,7 +278,7 @@ def test_multiplex_cutadapt_fq(expected_fixture, dir_tmp, multiplex_name):
                       os.path.join(dir_tmp, file_name))
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_umitools_extract_fq(extract_umis, is_multiplexed,
                              expected_fixture, dir_tmp,
@@ -310,7 +310,7 @@ def test_umitools_extract_fq(extract_umis, is_multiplexed,
                      workflow_files.UMI_EXTRACT_FQ)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_multiplex_umitools_extract_fq(
         extract_umis, expected_fixture, dir_tmp, multiplex_name):
@@ -340,7 +340,7 @@ def test_multiplex_umitools_extract_fq(
                       os.path.join(dir_tmp, file_name))
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_multiplex_deplex_num_reads_tsv(
         expected_fixture, dir_tmp, multiplex_name):
@@ -371,7 +371,7 @@ def test_multiplex_deplex_num_reads_tsv(
         na_to_empty_str=True)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_multiplex_deplex_sample_fq(
         expected_fixture, dir_tmp, multiplex_name, sample):
@@ -397,7 +397,7 @@ def test_multiplex_deplex_sample_fq(
         expected_fixture, dir_tmp, deplex_dir, fastq.FQ_FORMAT.format(sample))
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_multiplex_deplex_unassigned_fq(
         expected_fixture, dir_tmp, multiplex_name):
@@ -423,7 +423,7 @@ def test_multiplex_deplex_unassigned_fq(
         fastq.FQ_FORMAT.format(sample_sheets.UNASSIGNED_TAG))
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 @pytest.mark.parametrize("file_name", [
     workflow_files.NON_RRNA_FQ,
@@ -445,7 +445,7 @@ def test_hisat_fq(expected_fixture, dir_tmp, sample, file_name):
     compare_fq_files(expected_fixture, dir_tmp, sample, file_name)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 @pytest.mark.parametrize("file_name", [
     workflow_files.ORF_MAP_SAM,
@@ -472,7 +472,7 @@ def test_hisat2_sam(expected_fixture, dir_tmp, scratch_directory,
                       sample, file_name)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_trim5p_mismatch_sam(
         trim_5p_mismatches, expected_fixture, dir_tmp,
@@ -503,7 +503,7 @@ def test_trim5p_mismatch_sam(
                       sample, workflow_files.ORF_MAP_CLEAN_SAM)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_trim5p_mismatch_tsv(
         trim_5p_mismatches, expected_fixture, dir_tmp, sample):
@@ -530,7 +530,7 @@ def test_trim5p_mismatch_tsv(
                       workflow_files.TRIM_5P_MISMATCH_TSV)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_samtools_view_sort_index_orf_map_clean_bam(
         expected_fixture, dir_tmp, sample):
@@ -559,7 +559,7 @@ def test_samtools_view_sort_index_orf_map_clean_bam(
         os.path.join(dir_tmp, sample, bai_file_name))
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_samtools_index_dedup_bam(dedup_umis, dir_tmp, sample):
     """
@@ -624,7 +624,7 @@ def test_samtools_view_sort_index(dedup_umis, expected_fixture,
     utils.equal_file_sizes(expected_bai_file, actual_bai_file)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 @pytest.mark.parametrize("stats_file", ["edit_distance.tsv",
                                         "per_umi_per_position.tsv",
@@ -663,7 +663,7 @@ def test_umitools_dedup_stats_tsv(
     assert os.path.exists(actual_file), "Non-existent file: %s" % actual_file
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_umitools_pre_dedup_group_tsv(
         dedup_umis, group_umis, expected_fixture, dir_tmp, sample):
@@ -693,7 +693,7 @@ def test_umitools_pre_dedup_group_tsv(
                       workflow_files.PRE_DEDUP_GROUPS_TSV)
 
 
-@pytest.mark.usefixtures("skip_index_tmp_fixture")
+@pytest.mark.check_index_tmp
 @pytest.mark.usefixtures("prep_riboviz_fixture")
 def test_umitools_post_dedup_group_tsv(
         dedup_umis, group_umis, dir_tmp, sample):